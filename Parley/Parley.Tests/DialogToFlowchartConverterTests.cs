@@ -191,6 +191,23 @@ namespace Parley.Tests
             Assert.Equal(2, outgoingEdges.Count);
         }
 
+        [Fact]
+        public void GetOutgoingEdges_LeafNode_ReturnsEmpty()
+        {
+            // Arrange
+            var dialog = new Dialog();
+            var startPtr = dialog.Add();
+            startPtr!.Node!.Text.Add(0, "Hello");
+            dialog.AddNodeInternal(startPtr.Node, DialogNodeType.Entry);
+
+            // Act
+            var graph = _converter.Convert(dialog);
+
+            // Assert - Entry has no children; ROOT has exactly the one start edge
+            Assert.Empty(graph.GetOutgoingEdges("E0"));
+            Assert.Single(graph.GetOutgoingEdges("ROOT"));
+        }
+
         [Fact]
         public void Convert_ConditionalReply_SetsIsConditional()
         {
@@ -501,6 +518,99 @@ namespace Parley.Tests
 
         #endregion
 
+        #region Fingerprint Tests
+
+        [Fact]
+        public void ComputeFingerprint_UnchangedDialog_ReturnsSameValue()
+        {
+            // Arrange
+            var dialog = CreateFingerprintDialog();
+
+            // Act
+            var first = DialogToFlowchartConverter.ComputeFingerprint(dialog, "test.dlg");
+            var second = DialogToFlowchartConverter.ComputeFingerprint(dialog, "test.dlg");
+
+            // Assert
+            Assert.Equal(first, second);
+        }
+
+        [Fact]
+        public void ComputeFingerprint_TextChanged_ReturnsDifferentValue()
+        {
+            // Arrange
+            var dialog = CreateFingerprintDialog();
+            var before = DialogToFlowchartConverter.ComputeFingerprint(dialog);
+
+            // Act
+            dialog.Entries[0].Text.Add(0, "Changed text");
+            var after = DialogToFlowchartConverter.ComputeFingerprint(dialog);
+
+            // Assert
+            Assert.NotEqual(before, after);
+        }
+
+        [Fact]
+        public void ComputeTopologyFingerprint_TextChanged_ReturnsSameValue()
+        {
+            // Arrange
+            var dialog = CreateFingerprintDialog();
+            var before = DialogToFlowchartConverter.ComputeTopologyFingerprint(dialog);
+
+            // Act
+            dialog.Entries[0].Text.Add(0, "Changed text");
+            dialog.Entries[0].Speaker = "Guard";
+            var after = DialogToFlowchartConverter.ComputeTopologyFingerprint(dialog);
+
+            // Assert - Labels don't affect topology
+            Assert.Equal(before, after);
+        }
+
+        [Fact]
+        public void ComputeFingerprints_MatchesSeparateFingerprints()
+        {
+            // Arrange
+            var dialog = CreateFingerprintDialog();
+
+            // Act
+            var (content, topology) = DialogToFlowchartConverter.ComputeFingerprints(dialog, "test.dlg");
+
+            // Assert - Single walk yields the same values as the two separate calls
+            Assert.Equal(DialogToFlowchartConverter.ComputeFingerprint(dialog, "test.dlg"), content);
+            Assert.Equal(DialogToFlowchartConverter.ComputeTopologyFingerprint(dialog, "test.dlg"), topology);
+        }
+
+        [Fact]
+        public void ComputeFingerprint_PointerAdded_ReturnsDifferentValue()
+        {
+            // Arrange
+            var dialog = CreateFingerprintDialog();
+            var before = DialogToFlowchartConverter.ComputeFingerprint(dialog);
+
+            // Act
+            var reply = dialog.CreateNode(DialogNodeType.Reply);
+            reply!.Text.Add(0, "Goodbye");
+            dialog.AddNodeInternal(reply, DialogNodeType.Reply);
+            var replyPtr = dialog.CreatePtr();
+            replyPtr!.Type = DialogNodeType.Reply;
+            replyPtr.Node = reply;
+            dialog.Entries[0].Pointers.Add(replyPtr);
+            var after = DialogToFlowchartConverter.ComputeFingerprint(dialog);
+
+            // Assert
+            Assert.NotEqual(before, after);
+        }
+
+        private static Dialog CreateFingerprintDialog()
+        {
+            var dialog = new Dialog();
+            var startPtr = dialog.Add();
+            startPtr!.Node!.Text.Add(0, "Hello");
+            dialog.AddNodeInternal(startPtr.Node, DialogNodeType.Entry);
+            return dialog;
+        }
+
+        #endregion
+
         #region Static Factory Method Tests
 
         [Fact]
@@ -319,6 +319,42 @@ public class FlowViewTreeViewSyncTests : IDisposable
         Assert.True(receivedAllExpandedEvent);
     }
 
+    [Fact]
+    public void FlowVM_ExpandAll_NothingCollapsed_KeepsGraphAndPublishes()
+    {
+        // Arrange
+        var receivedAllExpandedEvent = false;
+        _flowVm.UpdateDialog(CreateDialogWithReplies(), "test.dlg");
+        var originalGraph = _flowVm.Graph;
+        _eventBus.DialogChanged += (s, e) =>
+        {
+            if (e.ChangeType == DialogChangeType.AllExpanded)
+                receivedAllExpandedEvent = true;
+        };
+
+        // Act
+        _flowVm.ExpandAll();
+
+        // Assert - No re-layout, but TreeView is still told
+        Assert.Same(originalGraph, _flowVm.Graph);
+        Assert.True(receivedAllExpandedEvent);
+    }
+
+    [Fact]
+    public void FlowVM_CollapseAll_AlreadyCollapsed_KeepsGraph()
+    {
+        // Arrange
+        _flowVm.UpdateDialog(CreateDialogWithReplies(), "test.dlg");
+        _flowVm.CollapseAll();
+        var collapsedGraph = _flowVm.Graph;
+
+        // Act
+        _flowVm.CollapseAll();
+
+        // Assert
+        Assert.Same(collapsedGraph, _flowVm.Graph);
+    }
+
     #endregion
 
     #region Navigation Event Tests
@@ -458,6 +494,48 @@ public class FlowViewTreeViewSyncTests : IDisposable
         Assert.NotNull(originalSelection);
     }
 
+    [Fact]
+    public void FlowVM_LinkSelection_SurvivesNoOpPanelUpdate()
+    {
+        // Arrange: FlowView click on a link node sets SelectedNodeId directly
+        var dialog = CreateDialogWithLink();
+        _flowVm.UpdateDialog(dialog, "test.dlg");
+        var linkId = _flowVm.FlowchartGraph!.Nodes.Values.First(n => n.IsLink).Id;
+        _flowVm.SelectedNodeId = linkId;
+
+        // Act: Same steps as FlowchartManager.UpdateAllPanels for an unchanged dialog
+        var graphReplaced = _flowVm.UpdateDialog(dialog, "test.dlg");
+        _flowVm.ResyncSelection(dialog.Entries[0], graphReplaced);
+
+        // Assert: Not moved to the link target's real node
+        Assert.False(graphReplaced);
+        Assert.Equal(linkId, _flowVm.SelectedNodeId);
+    }
+
+    [Fact]
+    public void FlowVM_ResyncSelection_GraphReplaced_SelectsTreeNode()
+    {
+        // Arrange
+        var dialog = CreateDialogWithLink();
+        _flowVm.UpdateDialog(dialog, "test.dlg");
+        _flowVm.SelectedNodeId = _flowVm.FlowchartGraph!.Nodes.Values.First(n => n.IsLink).Id;
+
+        // Act: Structural change rebuilds the graph
+        var reply = dialog.CreateNode(DialogNodeType.Reply)!;
+        reply.Text.Add(0, "Farewell");
+        dialog.AddNodeInternal(reply, DialogNodeType.Reply);
+        var replyPtr = dialog.CreatePtr()!;
+        replyPtr.Type = DialogNodeType.Reply;
+        replyPtr.Node = reply;
+        dialog.Entries[0].Pointers.Add(replyPtr);
+        var graphReplaced = _flowVm.UpdateDialog(dialog, "test.dlg");
+        _flowVm.ResyncSelection(reply, graphReplaced);
+
+        // Assert
+        Assert.True(graphReplaced);
+        Assert.Equal(_flowVm.FindNodeIdForDialogNode(reply), _flowVm.SelectedNodeId);
+    }
+
     [Fact]
     public void FlowVM_Clear_ResetsSelection()
     {
@@ -574,5 +652,19 @@ public class FlowViewTreeViewSyncTests : IDisposable
         return dialog;
     }
 
+    private Dialog CreateDialogWithLink()
+    {
+        // Entry -> Reply -> link back to Entry
+        var dialog = CreateDialogWithReplies();
+        var linkPtr = dialog.CreatePtr()!;
+        linkPtr.Type = DialogNodeType.Entry;
+        linkPtr.Index = 0;
+        linkPtr.Node = dialog.Entries[0];
+        linkPtr.IsLink = true;
+        dialog.Replies[0].Pointers.Add(linkPtr);
+
+        return dialog;
+    }
+
     #endregion
 }
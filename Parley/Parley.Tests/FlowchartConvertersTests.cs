@@ -106,6 +106,21 @@ namespace Parley.Tests
             Assert.Equal(((SolidColorBrush)entryResult).Color, ((SolidColorBrush)rootResult).Color);
         }
 
+        [Fact]
+        public void BackgroundConverter_RepeatedCalls_ReuseCachedBrush()
+        {
+            // Arrange
+            var converter = FlowchartNodeBackgroundConverter.Instance;
+            var values = new object?[] { FlowchartNodeType.Entry, false, "", ThemeVariant.Dark };
+
+            // Act
+            var first = converter.Convert(values, typeof(IBrush), null, CultureInfo.InvariantCulture);
+            var second = converter.Convert(values, typeof(IBrush), null, CultureInfo.InvariantCulture);
+
+            // Assert - Same brush instance shared by every node until the cache is invalidated
+            Assert.Same(first, second);
+        }
+
         [Fact]
         public void BackgroundConverter_LinkNode_ReturnsSameAsEntryNode()
         {
@@ -212,6 +227,21 @@ namespace Parley.Tests
             // PC color from SpeakerVisualHelper - should be blue-ish
         }
 
+        [Fact]
+        public void BorderConverter_SameSpeakerColor_ReusesBrush()
+        {
+            // Arrange
+            var converter = FlowchartNodeBorderConverter.Instance;
+            var values = new object?[] { FlowchartNodeType.Reply, false, "PC", ThemeVariant.Light };
+
+            // Act
+            var first = converter.Convert(values, typeof(IBrush), null, CultureInfo.InvariantCulture);
+            var second = converter.Convert(values, typeof(IBrush), null, CultureInfo.InvariantCulture);
+
+            // Assert - One shared brush per speaker color
+            Assert.Same(first, second);
+        }
+
         [Fact]
         public void BorderConverter_EntryNode_UsesOwnerColor()
         {
@@ -93,6 +93,158 @@ namespace Parley.Tests
             Assert.False(vm.FlowchartGraph.IsEmpty);
         }
 
+        [Fact]
+        public void UpdateDialog_UnchangedDialog_KeepsExistingGraph()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+
+            // Act
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert
+            Assert.Same(originalGraph, vm.Graph);
+        }
+
+        [Fact]
+        public void UpdateDialog_AfterNodeStylesInvalidated_RebuildsGraph()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+
+            // Act - Theme/speaker settings changed; dialog did not
+            FlowchartPanelViewModel.InvalidateNodeStyles();
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert
+            Assert.NotSame(originalGraph, vm.Graph);
+        }
+
+        [Fact]
+        public void UpdateDialog_ChangedTextOnly_PatchesWithoutRebuild()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+
+            // Act
+            dialog.Replies[0].Text.Add(0, "Sell something");
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert - Same layout, label updated in place
+            Assert.Same(originalGraph, vm.Graph);
+            var node = vm.FlowchartGraph!.Nodes.Values.First(n => n.OriginalNode == dialog.Replies[0]);
+            Assert.Equal("Sell something", node.Text);
+        }
+
+        [Fact]
+        public void UpdateDialog_AddedReply_RebuildsGraph()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+
+            // Act
+            var reply = dialog.CreateNode(DialogNodeType.Reply);
+            reply!.Text.Add(0, "Farewell");
+            dialog.AddNodeInternal(reply, DialogNodeType.Reply);
+            var replyPtr = dialog.CreatePtr();
+            replyPtr!.Type = DialogNodeType.Reply;
+            replyPtr.Node = reply;
+            dialog.Entries[0].Pointers.Add(replyPtr);
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert
+            Assert.NotSame(originalGraph, vm.Graph);
+        }
+
+        [Fact]
+        public void SelectNode_DoesNotRebuildGraph()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+
+            // Act
+            vm.SelectNode(dialog.Replies[1]);
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert - Selection is a binding change, not a graph change
+            Assert.Same(originalGraph, vm.Graph);
+            Assert.NotNull(vm.SelectedNodeId);
+        }
+
+        [Fact]
+        public void UpdateNodeContent_TextEdit_PatchesNodeWithoutRebuild()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+            var reply = dialog.Replies[0];
+
+            // Act
+            reply.Text.Add(0, "Sell something");
+            vm.UpdateNodeContent(dialog, reply, "test.dlg");
+
+            // Assert
+            Assert.Same(originalGraph, vm.Graph);
+            var node = vm.FlowchartGraph!.Nodes.Values.First(n => n.OriginalNode == reply);
+            Assert.Equal("Sell something", node.Text);
+        }
+
+        [Fact]
+        public void UpdateNodeContent_AfterSilentScriptEdit_NextUpdateDialogRebuilds()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            var dialog = CreateDialogWithReplies();
+            vm.UpdateDialog(dialog, "test.dlg");
+            var originalGraph = vm.Graph;
+            var reply = dialog.Replies[0];
+
+            // Act - Script edits publish no event; a later text edit must not mask them
+            dialog.Replies[1].ScriptAction = "nw_d1_action";
+            reply.Text.Add(0, "Sell something");
+            vm.UpdateNodeContent(dialog, reply, "test.dlg");
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Assert
+            Assert.NotSame(originalGraph, vm.Graph);
+            var node = vm.FlowchartGraph!.Nodes.Values.First(n => n.OriginalNode == dialog.Replies[1]);
+            Assert.True(node.HasAction);
+        }
+
+        [Fact]
+        public void UpdateNodeContent_DifferentDialog_Rebuilds()
+        {
+            // Arrange
+            var vm = new FlowchartPanelViewModel();
+            vm.UpdateDialog(CreateSimpleDialog(), "test.dlg");
+            var originalGraph = vm.Graph;
+            var otherDialog = CreateDialogWithReplies();
+
+            // Act
+            vm.UpdateNodeContent(otherDialog, otherDialog.Replies[0], "other.dlg");
+
+            // Assert
+            Assert.NotSame(originalGraph, vm.Graph);
+            Assert.Same(otherDialog, vm.CurrentDialog);
+        }
+
         #endregion
 
         #region RefreshGraph Tests (Issue #340)
@@ -256,6 +408,41 @@ namespace Parley.Tests
             Assert.Null(result);
         }
 
+        [Fact]
+        public void FindNodeIdForDialogNode_LinkedBeforeReached_ReturnsRealNode()
+        {
+            // Arrange - Entry's first pointer is a link to the reply, second is the real child,
+            // so the link node is added to the graph before the reply itself
+            var vm = new FlowchartPanelViewModel();
+            var dialog = new Dialog();
+            var startPtr = dialog.Add();
+            startPtr!.Node!.Text.Add(0, "What do you want?");
+            dialog.AddNodeInternal(startPtr.Node, DialogNodeType.Entry);
+
+            var reply = dialog.CreateNode(DialogNodeType.Reply);
+            reply!.Text.Add(0, "Nothing");
+            dialog.AddNodeInternal(reply, DialogNodeType.Reply);
+
+            var linkPtr = dialog.CreatePtr();
+            linkPtr!.Type = DialogNodeType.Reply;
+            linkPtr.Node = reply;
+            linkPtr.IsLink = true;
+            startPtr.Node.Pointers.Add(linkPtr);
+
+            var childPtr = dialog.CreatePtr();
+            childPtr!.Type = DialogNodeType.Reply;
+            childPtr.Node = reply;
+            startPtr.Node.Pointers.Add(childPtr);
+
+            vm.UpdateDialog(dialog, "test.dlg");
+
+            // Act
+            var result = vm.FindNodeIdForDialogNode(reply);
+
+            // Assert
+            Assert.Equal("R0", result);
+        }
+
         #endregion
 
         #region Status Text Tests
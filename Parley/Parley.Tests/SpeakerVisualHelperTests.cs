@@ -0,0 +1,62 @@
+using DialogEditor.Utils;
+using Parley.Tests.Mocks;
+using Xunit;
+
+namespace Parley.Tests
+{
+    /// <summary>
+    /// Tests for SpeakerVisualHelper hash-based NPC color and shape assignment.
+    /// Colors and shapes must be stable across sessions, so they can't depend on string.GetHashCode().
+    /// </summary>
+    public class SpeakerVisualHelperTests
+    {
+        [Fact]
+        public void GetNpcColor_EmptySpeaker_ReturnsOwnerOrange()
+        {
+            // Act
+            var color = SpeakerVisualHelper.ColorPalette.GetNpcColor(string.Empty);
+
+            // Assert
+            Assert.Equal(SpeakerVisualHelper.ColorPalette.Orange, color);
+        }
+
+        [Theory]
+        [InlineData("Guard", SpeakerVisualHelper.ColorPalette.Teal)]
+        [InlineData("Merchant", SpeakerVisualHelper.ColorPalette.Amber)]
+        [InlineData("Aribeth", SpeakerVisualHelper.ColorPalette.Purple)]
+        public void GetNpcColor_NamedSpeaker_ReturnsStablePaletteColor(string speaker, string expected)
+        {
+            // Act
+            var color = SpeakerVisualHelper.ColorPalette.GetNpcColor(speaker);
+
+            // Assert - Fixed expectation: same color in every process
+            Assert.Equal(expected, color);
+        }
+
+        [Fact]
+        public void StableHash_KnownInput_MatchesFnv1a()
+        {
+            // Act
+            var hash = SpeakerVisualHelper.StableHash("a");
+
+            // Assert - FNV-1a 32-bit reference value for "a"
+            Assert.Equal(0xE40C292Cu, hash);
+        }
+
+        [Theory]
+        [InlineData("Guard", SpeakerVisualHelper.SpeakerShape.Pentagon)]
+        [InlineData("Merchant", SpeakerVisualHelper.SpeakerShape.Diamond)]
+        [InlineData("Aribeth", SpeakerVisualHelper.SpeakerShape.Triangle)]
+        public void GetSpeakerShape_NamedSpeaker_ReturnsStableShape(string speaker, SpeakerVisualHelper.SpeakerShape expected)
+        {
+            // Arrange
+            var settings = new MockSettingsService { EnableNpcTagColoring = true };
+
+            // Act
+            var shape = SpeakerVisualHelper.GetSpeakerShape(speaker, isPC: false, settings);
+
+            // Assert - Fixed expectation: same shape in every process
+            Assert.Equal(expected, shape);
+        }
+    }
+}
@@ -25,6 +25,22 @@ namespace DialogEditor.Models
         private static readonly Color LightBgColor = Color.FromArgb(255, 0xFA, 0xFA, 0xFA); // Off-white
         private static readonly Color DarkBgColor = Color.FromArgb(255, 0x2D, 0x2D, 0x2D); // Dark gray
 
+        // Resolved brush per variant - every node shares it, so look it up once per theme.
+        // Two themes of the same variant have different backgrounds, so MainWindow clears
+        // this on every ThemeApplied, whether or not a flowchart panel is attached.
+        private static IBrush? _lightBrush;
+        private static IBrush? _darkBrush;
+
+        /// <summary>
+        /// Drops the cached background brushes so the next conversion re-reads theme resources.
+        /// Called on every theme change and before rebuilding the graph.
+        /// </summary>
+        public static void InvalidateCache()
+        {
+            _lightBrush = null;
+            _darkBrush = null;
+        }
+
         public object? Convert(IList<object?> values, Type targetType, object? parameter, CultureInfo culture)
         {
             // Values: NodeType, IsLink, Speaker, ActualThemeVariant
@@ -32,7 +48,9 @@ namespace DialogEditor.Models
 
             // All nodes use the same theme background for consistent text readability
             // Link/Root distinction is handled via FlowchartLinkOpacityConverter
-            return GetThemedBrush(isDark);
+            return isDark
+                ? _darkBrush ??= GetThemedBrush(true)
+                : _lightBrush ??= GetThemedBrush(false);
         }
 
         /// <summary>
@@ -80,6 +98,19 @@ namespace DialogEditor.Models
         private static readonly IBrush LinkBorder = new SolidColorBrush(Color.FromArgb(255, 0x9E, 0x9E, 0x9E)); // Gray
         private static readonly IBrush RootBorder = new SolidColorBrush(Color.FromArgb(255, 0x75, 0x75, 0x75)); // Medium gray
 
+        // Resolved brush per (speaker, isPC). Resolution reads the theme's PC/Owner colors and
+        // speaker preferences, so MainWindow clears this on every theme or speaker settings change.
+        private static readonly Dictionary<(string Speaker, bool IsPC), IBrush> ResolvedSpeakerBrushes = new();
+
+        /// <summary>
+        /// Drops resolved speaker colors so the next conversion re-reads theme and preferences.
+        /// Called on every theme change and before rebuilding the graph.
+        /// </summary>
+        public static void InvalidateCache()
+        {
+            ResolvedSpeakerBrushes.Clear();
+        }
+
         public object? Convert(IList<object?> values, Type targetType, object? parameter, CultureInfo culture)
         {
             // Values: NodeType, IsLink, Speaker, ActualThemeVariant (4th param for theme reactivity, not used for border color)
@@ -98,15 +129,35 @@ namespace DialogEditor.Models
 
             // Use SpeakerVisualHelper for consistent coloring with TreeView
             bool isPC = nodeType == FlowchartNodeType.Reply;
+            if (ResolvedSpeakerBrushes.TryGetValue((speaker, isPC), out var resolved))
+                return resolved;
+
+            var brush = ResolveSpeakerBrush(speaker, isPC, nodeType);
+            ResolvedSpeakerBrushes[(speaker, isPC)] = brush;
+            return brush;
+        }
+
+        private static IBrush ResolveSpeakerBrush(string speaker, bool isPC, FlowchartNodeType nodeType)
+        {
             string hexColor = SpeakerVisualHelper.GetSpeakerColor(speaker, isPC);
 
-            // Dynamic speaker color from SpeakerVisualHelper (theme-aware)
+            // Dynamic speaker color from SpeakerVisualHelper (theme-aware).
+            // A dialog has only a handful of speaker colors, so share one brush per color.
+            if (SpeakerBrushes.TryGetValue(hexColor, out var cachedBrush))
+                return cachedBrush;
+
             if (Color.TryParse(hexColor, out var speakerColor))
-                return new SolidColorBrush(speakerColor);
+            {
+                var brush = new SolidColorBrush(speakerColor);
+                SpeakerBrushes[hexColor] = brush;
+                return brush;
+            }
 
             return CreateDefaultBrush(nodeType);
         }
 
+        private static readonly Dictionary<string, IBrush> SpeakerBrushes = new(StringComparer.OrdinalIgnoreCase);
+
         private static readonly IBrush DefaultReplyBrush = new SolidColorBrush(Color.FromArgb(255, 0x21, 0x96, 0xF3)); // Blue
         private static readonly IBrush DefaultEntryBrush = new SolidColorBrush(Color.FromArgb(255, 0xFF, 0x98, 0x00)); // Orange
 
@@ -127,11 +178,15 @@ namespace DialogEditor.Models
     {
         public static readonly FlowchartLinkBorderThicknessConverter Instance = new();
 
+        // Boxed once - Thickness is a struct, so returning it as object allocates per call
+        private static readonly object LinkThickness = new Thickness(1);
+        private static readonly object NodeThickness = new Thickness(2);
+
         public object? Convert(object? value, Type targetType, object? parameter, CultureInfo culture)
         {
             var isLink = value as bool? ?? false;
             // Links get thinner border, regular nodes get thicker solid border
-            return isLink ? new Thickness(1) : new Thickness(2);
+            return isLink ? LinkThickness : NodeThickness;
         }
 
         public object? ConvertBack(object? value, Type targetType, object? parameter, CultureInfo culture)
@@ -171,6 +226,13 @@ namespace DialogEditor.Models
     {
         public static readonly FlowchartLinkOpacityConverter Instance = new();
 
+        // One boxed value per (node kind, theme) - evaluated for every node in the graph
+        private static readonly object FullOpacity = 1.0;
+        private static readonly object RootLightOpacity = 0.8;
+        private static readonly object RootDarkOpacity = 0.9;
+        private static readonly object LinkLightOpacity = 0.7;
+        private static readonly object LinkDarkOpacity = 0.85;
+
         public object? Convert(IList<object?> values, Type targetType, object? parameter, CultureInfo culture)
         {
             // Values: IsLink, NodeType
@@ -179,7 +241,7 @@ namespace DialogEditor.Models
 
             // Regular nodes get full opacity
             if (!isLink && nodeType != FlowchartNodeType.Root)
-                return 1.0;
+                return FullOpacity;
 
             // Links and Root nodes are slightly translucent to indicate they're special
             // Use higher opacity in dark themes for better readability
@@ -196,10 +258,10 @@ namespace DialogEditor.Models
 
             // Root nodes get slightly less opacity than regular nodes
             if (nodeType == FlowchartNodeType.Root)
-                return isDark ? 0.9 : 0.8;
+                return isDark ? RootDarkOpacity : RootLightOpacity;
 
             // Link nodes get more opacity reduction
-            return isDark ? 0.85 : 0.7;
+            return isDark ? LinkDarkOpacity : LinkLightOpacity;
         }
     }
 
@@ -212,10 +274,15 @@ namespace DialogEditor.Models
     {
         public static readonly FlowchartNodeSelectionBorderConverter Instance = new();
 
+        // Re-evaluated for every node on each selection change; box the results once
+        private static readonly object LinkThickness = new Thickness(2);
+        private static readonly object NodeThickness = new Thickness(3);
+        private static readonly object SelectedThickness = new Thickness(5);
+
         public object? Convert(IList<object?> values, Type targetType, object? parameter, CultureInfo culture)
         {
             if (values.Count < 3)
-                return new Thickness(3);
+                return NodeThickness;
 
             var nodeId = values[0] as string;
             var isLink = values[1] as bool? ?? false;
@@ -228,10 +295,10 @@ namespace DialogEditor.Models
 
             // Selected nodes get extra thick border for emphasis
             if (isSelected)
-                return new Thickness(5);
+                return SelectedThickness;
 
             // Links get thinner border, regular nodes get thick border for speaker color visibility
-            return isLink ? new Thickness(2) : new Thickness(3);
+            return isLink ? LinkThickness : NodeThickness;
         }
     }
 
@@ -277,12 +344,15 @@ namespace DialogEditor.Models
     {
         public static readonly FlowchartHasChildrenConverter Instance = new();
 
+        private static readonly object BoxedTrue = true;
+        private static readonly object BoxedFalse = false;
+
         public object? Convert(object? value, Type targetType, object? parameter, CultureInfo culture)
         {
             // Handle boxed int properly
-            if (value is int childCount)
-                return childCount > 0;
-            return false;
+            if (value is int childCount && childCount > 0)
+                return BoxedTrue;
+            return BoxedFalse;
         }
 
         public object? ConvertBack(object? value, Type targetType, object? parameter, CultureInfo culture)
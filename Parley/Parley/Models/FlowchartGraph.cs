@@ -41,12 +41,12 @@ namespace DialogEditor.Models
         /// <summary>
         /// Display text for the node (truncated dialog text)
         /// </summary>
-        public string Text { get; }
+        public string Text { get; private set; }
 
         /// <summary>
         /// Speaker tag (for Entry nodes: NPC tag or "Owner"; for Reply: "PC")
         /// </summary>
-        public string Speaker { get; }
+        public string Speaker { get; private set; }
 
         /// <summary>
         /// True if this node has a conditional script (ScriptAppears)
@@ -61,7 +61,7 @@ namespace DialogEditor.Models
         /// <summary>
         /// True if this node has a quest tag assigned (Quest field is not empty)
         /// </summary>
-        public bool HasQuestTag { get; }
+        public bool HasQuestTag { get; private set; }
 
         /// <summary>
         /// True if this is a link node (points to another node rather than containing content)
@@ -101,6 +101,42 @@ namespace DialogEditor.Models
             }
         }
 
+        /// <summary>
+        /// Updates the displayed content in place after a text-only edit, so the
+        /// existing graph can repaint without a rebuild.
+        /// </summary>
+        /// <returns>True if any value changed</returns>
+        public bool UpdateContent(string text, string speaker, bool hasQuestTag)
+        {
+            text ??= string.Empty;
+            speaker ??= string.Empty;
+            bool changed = false;
+
+            if (Text != text)
+            {
+                Text = text;
+                PropertyChanged?.Invoke(this, new PropertyChangedEventArgs(nameof(Text)));
+                PropertyChanged?.Invoke(this, new PropertyChangedEventArgs(nameof(DisplayText)));
+                changed = true;
+            }
+
+            if (Speaker != speaker)
+            {
+                Speaker = speaker;
+                PropertyChanged?.Invoke(this, new PropertyChangedEventArgs(nameof(Speaker)));
+                changed = true;
+            }
+
+            if (HasQuestTag != hasQuestTag)
+            {
+                HasQuestTag = hasQuestTag;
+                PropertyChanged?.Invoke(this, new PropertyChangedEventArgs(nameof(HasQuestTag)));
+                changed = true;
+            }
+
+            return changed;
+        }
+
         /// <summary>
         /// Number of visible children (for collapse indicator display).
         /// Set during graph building.
@@ -121,6 +157,7 @@ namespace DialogEditor.Models
             bool hasQuestTag = false)
         {
             Id = id ?? throw new ArgumentNullException(nameof(id));
+            IndexPrefix = $"[{Id}] ";
             NodeType = nodeType;
             Text = text ?? string.Empty;
             Speaker = speaker ?? string.Empty;
@@ -136,8 +173,9 @@ namespace DialogEditor.Models
         /// <summary>
         /// Issue #1921: Index prefix for debugging (e.g., "[E5] " or "[R12] ").
         /// Derived from the node's Id which is already in E{n}/R{n} format.
+        /// Id is immutable, so the string is built once rather than on every binding read.
         /// </summary>
-        public string IndexPrefix => $"[{Id}] ";
+        public string IndexPrefix { get; }
 
         /// <summary>
         /// Display text for flowchart nodes. Returns full text - truncation handled by XAML MaxLines.
@@ -242,6 +280,13 @@ namespace DialogEditor.Models
         /// </summary>
         public List<FlowchartEdge> Edges { get; } = new();
 
+        // Outgoing edges per source node, maintained by AddEdge for subtree walks (collapse)
+        private readonly Dictionary<string, List<FlowchartEdge>> _outgoingEdges = new();
+
+        // Flowchart node per source DialogNode, maintained by AddNode for TreeView selection sync.
+        // A DialogNode can appear once as itself and again as link nodes; the real node wins.
+        private readonly Dictionary<DialogNode, FlowchartNode> _nodesByDialogNode = new();
+
         /// <summary>
         /// IDs of root nodes (entry points to the dialog - typically StartingList entries)
         /// </summary>
@@ -264,6 +309,13 @@ namespace DialogEditor.Models
         {
             if (node == null) throw new ArgumentNullException(nameof(node));
             Nodes[node.Id] = node;
+
+            var original = node.OriginalNode;
+            if (original != null &&
+                (!_nodesByDialogNode.TryGetValue(original, out var existing) || (existing.IsLink && !node.IsLink)))
+            {
+                _nodesByDialogNode[original] = node;
+            }
         }
 
         /// <summary>
@@ -273,6 +325,13 @@ namespace DialogEditor.Models
         {
             if (edge == null) throw new ArgumentNullException(nameof(edge));
             Edges.Add(edge);
+
+            if (!_outgoingEdges.TryGetValue(edge.SourceId, out var outgoing))
+            {
+                outgoing = new List<FlowchartEdge>();
+                _outgoingEdges[edge.SourceId] = outgoing;
+            }
+            outgoing.Add(edge);
         }
 
         /// <summary>
@@ -283,16 +342,23 @@ namespace DialogEditor.Models
             return Nodes.TryGetValue(id, out var node) ? node : null;
         }
 
+        /// <summary>
+        /// Get the flowchart node representing a DialogNode, preferring the node itself
+        /// over link nodes that point to it
+        /// </summary>
+        public FlowchartNode? GetNodeForDialogNode(DialogNode dialogNode)
+        {
+            return _nodesByDialogNode.TryGetValue(dialogNode, out var node) ? node : null;
+        }
+
         /// <summary>
         /// Get all edges originating from a node
         /// </summary>
         public IEnumerable<FlowchartEdge> GetOutgoingEdges(string nodeId)
         {
-            foreach (var edge in Edges)
-            {
-                if (edge.SourceId == nodeId)
-                    yield return edge;
-            }
+            return _outgoingEdges.TryGetValue(nodeId, out var outgoing)
+                ? outgoing
+                : Array.Empty<FlowchartEdge>();
         }
 
         /// <summary>
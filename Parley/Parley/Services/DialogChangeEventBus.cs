@@ -173,9 +173,13 @@ namespace DialogEditor.Services
                 return;
             }
 
-            UnifiedLogger.LogApplication(LogLevel.DEBUG,
-                $"DialogChangeEventBus: Publishing {args.ChangeType} event" +
-                (args.AffectedNode != null ? $" for node '{args.AffectedNode.DisplayText.Substring(0, Math.Min(30, args.AffectedNode.DisplayText.Length))}'" : ""));
+            // Skip building the message (DisplayText + Substring) on every edit when DEBUG is off
+            if (UnifiedLogger.CurrentLogLevel >= LogLevel.DEBUG)
+            {
+                UnifiedLogger.LogApplication(LogLevel.DEBUG,
+                    $"DialogChangeEventBus: Publishing {args.ChangeType} event" +
+                    (args.AffectedNode != null ? $" for node '{args.AffectedNode.DisplayText.Substring(0, Math.Min(30, args.AffectedNode.DisplayText.Length))}'" : ""));
+            }
 
             DialogChanged?.Invoke(this, args);
         }
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Runtime.CompilerServices;
 using DialogEditor.Models;
 
 namespace DialogEditor.Services
@@ -122,17 +123,15 @@ namespace DialogEditor.Services
         /// </summary>
         private void ProcessNode(DialogNode node, DialogPtr? sourcePointer, FlowchartGraph graph)
         {
-            var nodeId = GetNodeId(node);
-
-            // Check for circular reference
-            if (_visitedNodes.Contains(node))
+            // Check for circular reference (single hash lookup: Add fails if already visited)
+            if (!_visitedNodes.Add(node))
             {
                 // Already processed - don't recurse, but we still need to handle
                 // incoming edges from other nodes (handled by caller)
                 return;
             }
 
-            _visitedNodes.Add(node);
+            var nodeId = GetNodeId(node);
 
             // Create flowchart node
             var flowchartNode = CreateFlowchartNode(node, nodeId, sourcePointer);
@@ -177,11 +176,8 @@ namespace DialogEditor.Services
                     ));
 
                     // Ensure the target node exists (it may only be reachable via links)
-                    // Process it if not already visited - this creates the node in the graph
-                    if (!_visitedNodes.Contains(childPtr.Node))
-                    {
-                        ProcessNode(childPtr.Node, childPtr, graph);
-                    }
+                    // ProcessNode returns immediately if it was already visited
+                    ProcessNode(childPtr.Node, childPtr, graph);
 
                     // Note: We don't create an edge from link node to actual target
                     // The link node is just a visual indicator that this path leads to
@@ -242,6 +238,73 @@ namespace DialogEditor.Services
             return flowchartNode;
         }
 
+        /// <summary>
+        /// Computes a fingerprint of everything Convert reads from a dialog: node order,
+        /// text, speaker, script/quest flags and pointer targets. For the same Dialog
+        /// instance, an unchanged fingerprint means Convert would build the same graph,
+        /// so callers can skip the conversion and the GraphPanel re-layout.
+        /// </summary>
+        public static int ComputeFingerprint(Dialog dialog, string? fileName = null)
+        {
+            return ComputeFingerprints(dialog, fileName).Content;
+        }
+
+        /// <summary>
+        /// Like <see cref="ComputeFingerprint(Dialog, string?)"/> but ignores the fields
+        /// FlowchartNode.UpdateContent can patch in place (text, speaker, quest tag).
+        /// Equal topology fingerprints mean the graph's nodes and edges are unchanged.
+        /// </summary>
+        public static int ComputeTopologyFingerprint(Dialog dialog, string? fileName = null)
+        {
+            return ComputeFingerprints(dialog, fileName).Topology;
+        }
+
+        /// <summary>
+        /// Computes both fingerprints in a single walk of the dialog. Use this when both
+        /// are needed, instead of calling the two methods above.
+        /// </summary>
+        public static (int Content, int Topology) ComputeFingerprints(Dialog dialog, string? fileName = null)
+        {
+            var topology = new HashCode();
+            var labels = new HashCode();
+            topology.Add(fileName);
+            AddPointers(ref topology, dialog.Starts);
+            AddNodes(ref topology, ref labels, dialog.Entries);
+            AddNodes(ref topology, ref labels, dialog.Replies);
+
+            // Labels are hashed in node order, so combined with the topology they cover
+            // everything Convert reads
+            var topologyHash = topology.ToHashCode();
+            return (HashCode.Combine(topologyHash, labels.ToHashCode()), topologyHash);
+        }
+
+        private static void AddNodes(ref HashCode topology, ref HashCode labels, List<DialogNode> nodes)
+        {
+            topology.Add(nodes.Count);
+            foreach (var node in nodes)
+            {
+                topology.Add(RuntimeHelpers.GetHashCode(node));
+                topology.Add(node.Type);
+                topology.Add(string.IsNullOrEmpty(node.ScriptAction));
+                AddPointers(ref topology, node.Pointers);
+
+                labels.Add(node.DisplayText);
+                labels.Add(node.Speaker);
+                labels.Add(string.IsNullOrEmpty(node.Quest));
+            }
+        }
+
+        private static void AddPointers(ref HashCode hash, List<DialogPtr> pointers)
+        {
+            hash.Add(pointers.Count);
+            foreach (var ptr in pointers)
+            {
+                hash.Add(ptr?.Node != null ? RuntimeHelpers.GetHashCode(ptr.Node) : 0);
+                hash.Add(ptr?.IsLink ?? false);
+                hash.Add(ptr?.ScriptAppears);
+            }
+        }
+
         /// <summary>
         /// Create an empty graph (utility method for testing/UI)
         /// </summary>
@@ -1,5 +1,4 @@
 using System.Collections.Generic;
-using System.Linq;
 using AvaloniaGraphControl;
 using DialogEditor.Models;
 
@@ -25,22 +24,23 @@ namespace DialogEditor.Services
                 return graph;
             }
 
-            // Build node lookup for edge creation
-            var nodeMap = new Dictionary<string, FlowchartNode>();
-            foreach (var node in flowchartGraph.Nodes.Values)
-            {
-                nodeMap[node.Id] = node;
-            }
+            var nodes = flowchartGraph.Nodes;
+            var edges = flowchartGraph.Edges;
+
+            // Nodes that appear on at least one edge - the rest need a self-edge below
+            var connectedNodeIds = new HashSet<string>();
 
             // Add edges in REVERSE order - MSAGL Sugiyama places later-added sibling edges
             // to the left, so by reversing we get first-evaluated nodes on the left
             // (matching reading order: first evaluated = leftmost, last = rightmost)
-            var edgesList = flowchartGraph.Edges.ToList();
-            for (int i = edgesList.Count - 1; i >= 0; i--)
+            for (int i = edges.Count - 1; i >= 0; i--)
             {
-                var edge = edgesList[i];
-                if (nodeMap.TryGetValue(edge.SourceId, out var sourceNode) &&
-                    nodeMap.TryGetValue(edge.TargetId, out var targetNode))
+                var edge = edges[i];
+                connectedNodeIds.Add(edge.SourceId);
+                connectedNodeIds.Add(edge.TargetId);
+
+                if (nodes.TryGetValue(edge.SourceId, out var sourceNode) &&
+                    nodes.TryGetValue(edge.TargetId, out var targetNode))
                 {
                     // Create edge with arrow at target
                     var avaloniaEdge = new Edge(
@@ -55,21 +55,11 @@ namespace DialogEditor.Services
             // Handle orphan nodes (nodes with no edges) - one-liners and disconnected entries
             // AvaloniaGraphControl discovers nodes through edges, so isolated nodes need
             // a dummy self-edge to appear in the graph
-            foreach (var node in flowchartGraph.Nodes.Values)
+            foreach (var node in nodes.Values)
             {
-                bool hasEdge = false;
-                foreach (var edge in flowchartGraph.Edges)
-                {
-                    if (edge.SourceId == node.Id || edge.TargetId == node.Id)
-                    {
-                        hasEdge = true;
-                        break;
-                    }
-                }
-
                 // If node has no edges, add a self-referencing edge so it appears in the graph
                 // This handles one-liners and other disconnected nodes
-                if (!hasEdge)
+                if (!connectedNodeIds.Contains(node.Id))
                 {
                     graph.Edges.Add(new Edge(node, node, headSymbol: Edge.Symbol.None));
                 }
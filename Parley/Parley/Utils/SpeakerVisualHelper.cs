@@ -62,11 +62,28 @@ namespace DialogEditor.Utils
                 if (string.IsNullOrEmpty(speakerName))
                     return Orange;
 
-                int hash = Math.Abs(speakerName.GetHashCode());
-                return NpcColors[hash % NpcColors.Length];
+                return NpcColors[StableHash(speakerName) % (uint)NpcColors.Length];
             }
         }
 
+        /// <summary>
+        /// FNV-1a hash of a speaker tag. string.GetHashCode() is randomized per process,
+        /// so it can't keep a speaker's color consistent across sessions.
+        /// </summary>
+        internal static uint StableHash(string value)
+        {
+            uint hash = 2166136261;
+            foreach (char c in value)
+            {
+                hash ^= c;
+                hash *= 16777619;
+            }
+            return hash;
+        }
+
+        // Shapes assigned to NPCs without a preference (PC and Owner shapes are fixed)
+        private static readonly SpeakerShape[] NpcShapes = { SpeakerShape.Triangle, SpeakerShape.Diamond, SpeakerShape.Pentagon, SpeakerShape.Star };
+
         /// <summary>
         /// Gets the shape icon for a dialog speaker based on their identity.
         /// PC always gets Circle, Owner always gets Square, other NPCs check preferences first, then use hash-assigned shapes (unless disabled).
@@ -97,10 +114,8 @@ namespace DialogEditor.Utils
             if (!svc.EnableNpcTagColoring)
                 return SpeakerShape.Square;
 
-            // Other NPCs get shapes based on hash
-            var availableShapes = new[] { SpeakerShape.Triangle, SpeakerShape.Diamond, SpeakerShape.Pentagon, SpeakerShape.Star };
-            int hash = Math.Abs(speaker.GetHashCode());
-            return availableShapes[hash % availableShapes.Length];
+            // Other NPCs get shapes based on a stable hash (same shape every session)
+            return NpcShapes[StableHash(speaker) % (uint)NpcShapes.Length];
         }
 
         /// <summary>
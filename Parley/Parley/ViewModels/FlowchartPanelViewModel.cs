@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Linq;
 using AvaloniaGraphControl;
 using CommunityToolkit.Mvvm.ComponentModel;
 using DialogEditor.Models;
@@ -15,9 +14,18 @@ namespace DialogEditor.ViewModels
     /// </summary>
     public partial class FlowchartPanelViewModel : ViewModelBase
     {
+        private const string NoDialogStatus = "No dialog loaded";
+
         private readonly DialogToFlowchartConverter _converter = new();
         private FlowchartGraph? _flowchartGraph;
         private Dialog? _sourceDialog; // Keep source for refresh (#340)
+        private int? _lastFingerprint; // Fingerprint of the dialog behind _flowchartGraph
+        private int? _lastTopologyFingerprint; // Same, ignoring text/speaker/quest (patchable in place)
+        private int _builtStyleGeneration = -1; // _styleGeneration when _flowchartGraph was built
+
+        // Bumped when theme or speaker settings change node styling. The fingerprints don't
+        // cover those, so a graph built under an older generation is rebuilt, not skipped.
+        private static int _styleGeneration;
 
         /// <summary>
         /// The current dialog being displayed (#240: needed for drag-drop sibling lookup).
@@ -30,7 +38,7 @@ namespace DialogEditor.ViewModels
         private Graph? _graph;
 
         [ObservableProperty]
-        private string _statusText = "No dialog loaded";
+        private string _statusText = NoDialogStatus;
 
         [ObservableProperty]
         private bool _hasContent;
@@ -50,12 +58,16 @@ namespace DialogEditor.ViewModels
         /// Maximum lines to display in flowchart nodes before truncation (#813).
         /// Bound from UISettingsService for XAML data binding.
         /// </summary>
-        public int NodeMaxLines => Program.Services.GetRequiredService<UISettingsService>().FlowchartNodeMaxLines;
+        public int NodeMaxLines => UISettings.FlowchartNodeMaxLines;
 
         /// <summary>
         /// Flowchart node width in pixels (#906). Bound for XAML MaxWidth.
         /// </summary>
-        public int NodeWidth => Program.Services.GetRequiredService<UISettingsService>().FlowchartNodeWidth;
+        public int NodeWidth => UISettings.FlowchartNodeWidth;
+
+        // Singleton service, resolved on first use so the view model can be built without DI (tests)
+        private UISettingsService? _uiSettings;
+        private UISettingsService UISettings => _uiSettings ??= Program.Services.GetRequiredService<UISettingsService>();
 
         /// <summary>
         /// Computed minimum width for flowchart nodes (#906). NodeWidth * 0.6.
@@ -77,21 +89,57 @@ namespace DialogEditor.ViewModels
         /// </summary>
         /// <param name="dialog">The dialog to display</param>
         /// <param name="fileName">Optional filename for display</param>
-        public void UpdateDialog(Dialog? dialog, string? fileName = null)
+        /// <returns>True if the displayed graph was replaced; false if it was kept or patched in place</returns>
+        public bool UpdateDialog(Dialog? dialog, string? fileName = null)
         {
             FileName = fileName;
 
             if (dialog == null)
             {
                 Graph = null;
-                StatusText = "No dialog loaded";
+                StatusText = NoDialogStatus;
                 HasContent = false;
                 _sourceDialog = null;
-                return;
+                _lastFingerprint = null;
+                _lastTopologyFingerprint = null;
+                return true;
+            }
+
+            // Skip conversion and re-layout when nothing the graph shows has changed
+            var (fingerprint, topologyFingerprint) = DialogToFlowchartConverter.ComputeFingerprints(dialog, fileName);
+            if (ReferenceEquals(dialog, _sourceDialog) && _flowchartGraph != null && Graph != null &&
+                _builtStyleGeneration == _styleGeneration)
+            {
+                if (fingerprint == _lastFingerprint)
+                {
+                    UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart unchanged, skipping rebuild");
+                    return false;
+                }
+
+                // Same nodes and edges, only labels changed - patch them like a TextOnly edit
+                if (topologyFingerprint == _lastTopologyFingerprint)
+                {
+                    foreach (var node in _flowchartGraph.Nodes.Values)
+                    {
+                        var source = node.OriginalNode;
+                        if (source == null)
+                            continue;
+                        node.UpdateContent(source.DisplayText, source.Speaker,
+                            !node.IsLink && !string.IsNullOrEmpty(source.Quest));
+                    }
+                    _lastFingerprint = fingerprint;
+                    UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart labels changed, patched in place");
+                    return false;
+                }
             }
 
             // Store source for refresh (#340)
             _sourceDialog = dialog;
+            _lastFingerprint = null;
+            _lastTopologyFingerprint = null;
+
+            // Theme or speaker settings may have changed while no panel was attached to hear it
+            InvalidateConverterCaches();
 
             try
             {
@@ -103,11 +151,14 @@ namespace DialogEditor.ViewModels
                     Graph = null;
                     StatusText = "Dialog is empty";
                     HasContent = false;
-                    return;
+                    return true;
                 }
 
                 // Store for later lookup
                 _flowchartGraph = flowchartGraph;
+                _lastFingerprint = fingerprint;
+                _lastTopologyFingerprint = topologyFingerprint;
+                _builtStyleGeneration = _styleGeneration;
 
                 // Convert to AvaloniaGraphControl format
                 Graph = FlowchartGraphAdapter.ToAvaloniaGraph(flowchartGraph);
@@ -123,6 +174,8 @@ namespace DialogEditor.ViewModels
                 HasContent = false;
                 UnifiedLogger.LogUI(LogLevel.ERROR, $"Flowchart conversion failed: {ex.Message}");
             }
+
+            return true;
         }
 
         /// <summary>
@@ -130,6 +183,9 @@ namespace DialogEditor.ViewModels
         /// </summary>
         public void RefreshGraph()
         {
+            // Theme or settings may have changed - re-resolve shared node brushes
+            InvalidateConverterCaches();
+
             if (_sourceDialog == null)
                 return;
 
@@ -141,6 +197,8 @@ namespace DialogEditor.ViewModels
                 if (!flowchartGraph.IsEmpty)
                 {
                     _flowchartGraph = flowchartGraph;
+                    (_lastFingerprint, _lastTopologyFingerprint) = DialogToFlowchartConverter.ComputeFingerprints(_sourceDialog, FileName);
+                    _builtStyleGeneration = _styleGeneration;
                     Graph = null;
                     Graph = FlowchartGraphAdapter.ToAvaloniaGraph(flowchartGraph);
                     UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart fully rebuilt for color refresh");
@@ -152,20 +210,81 @@ namespace DialogEditor.ViewModels
             }
         }
 
+        private static void InvalidateConverterCaches()
+        {
+            FlowchartNodeBackgroundConverter.InvalidateCache();
+            FlowchartNodeBorderConverter.InvalidateCache();
+        }
+
+        /// <summary>
+        /// Marks node styling stale in every flowchart after a theme or speaker settings change.
+        /// Clears the shared brush caches, and the next UpdateDialog on each panel rebuilds even
+        /// if the dialog is unchanged (including panels that were detached at the time).
+        /// </summary>
+        public static void InvalidateNodeStyles()
+        {
+            InvalidateConverterCaches();
+            _styleGeneration++;
+        }
+
         /// <summary>
         /// Clear the flowchart display
         /// </summary>
         public void Clear()
         {
             Graph = null;
-            StatusText = "No dialog loaded";
+            StatusText = NoDialogStatus;
             HasContent = false;
             FileName = null;
             _flowchartGraph = null;
             _sourceDialog = null;
+            _lastFingerprint = null;
+            _lastTopologyFingerprint = null;
             SelectedNodeId = null;
         }
 
+        /// <summary>
+        /// Applies a text-only edit (#2032) to the displayed graph. Nodes showing the changed
+        /// DialogNode (including link nodes that mirror it) are patched in place, so the graph
+        /// is not re-converted or re-laid out. Falls back to UpdateDialog when the node isn't shown.
+        /// </summary>
+        /// <param name="dialog">The dialog containing the changed node</param>
+        /// <param name="changedNode">The node whose text, speaker or quest changed</param>
+        /// <param name="fileName">Optional filename for display</param>
+        public void UpdateNodeContent(Dialog? dialog, DialogNode? changedNode, string? fileName = null)
+        {
+            if (changedNode == null || dialog == null || !ReferenceEquals(dialog, _sourceDialog) ||
+                fileName != FileName || _flowchartGraph == null || Graph == null ||
+                _builtStyleGeneration != _styleGeneration)
+            {
+                UpdateDialog(dialog, fileName);
+                return;
+            }
+
+            bool found = false;
+            foreach (var node in _flowchartGraph.Nodes.Values)
+            {
+                if (node.OriginalNode != changedNode)
+                    continue;
+
+                found = true;
+                // Link nodes mirror the target's text and speaker but never show the quest badge
+                node.UpdateContent(changedNode.DisplayText, changedNode.Speaker,
+                    !node.IsLink && !string.IsNullOrEmpty(changedNode.Quest));
+            }
+
+            if (!found)
+            {
+                UpdateDialog(dialog, fileName);
+                return;
+            }
+
+            // Only this node was patched - script edits that publish no event may have changed
+            // other nodes, so let the next UpdateDialog reconcile (label patch or rebuild)
+            _lastFingerprint = null;
+            UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart node content updated in place");
+        }
+
         /// <summary>
         /// Finds the FlowchartNode ID for a given DialogNode
         /// </summary>
@@ -174,10 +293,7 @@ namespace DialogEditor.ViewModels
             if (dialogNode == null || _flowchartGraph == null)
                 return null;
 
-            var flowchartNode = _flowchartGraph.Nodes.Values
-                .FirstOrDefault(n => n.OriginalNode == dialogNode);
-
-            return flowchartNode?.Id;
+            return _flowchartGraph.GetNodeForDialogNode(dialogNode)?.Id;
         }
 
         /// <summary>
@@ -192,6 +308,22 @@ namespace DialogEditor.ViewModels
             }
         }
 
+        /// <summary>
+        /// Re-applies the TreeView selection after UpdateDialog. Only needed when the graph was
+        /// replaced or the current selection no longer resolves; otherwise the FlowView selection
+        /// is kept, since it may be a link node the TreeView can't express (it maps to the real node).
+        /// </summary>
+        /// <param name="dialogNode">The node selected in the TreeView</param>
+        /// <param name="graphReplaced">Result of the preceding UpdateDialog call</param>
+        public void ResyncSelection(DialogNode? dialogNode, bool graphReplaced)
+        {
+            if (!graphReplaced && (SelectedNodeId == null ||
+                _flowchartGraph?.Nodes.ContainsKey(SelectedNodeId) == true))
+                return;
+
+            SelectNode(dialogNode);
+        }
+
         #region Collapse/Expand Support (#251)
 
         /// <summary>
@@ -269,13 +401,20 @@ namespace DialogEditor.ViewModels
                 return;
 
             // Add all nodes that have children to collapsed set
+            bool changed = false;
             foreach (var node in _flowchartGraph.Nodes.Values)
             {
-                if (node.ChildCount > 0)
-                    _collapsedNodeIds.Add(node.Id);
+                if (node.ChildCount == 0)
+                    continue;
+
+                _collapsedNodeIds.Add(node.Id);
+                if (!node.IsCollapsed)
+                    changed = true;
             }
 
-            RebuildGraphWithCollapseState();
+            // Skip the re-layout when everything is already shown collapsed
+            if (changed)
+                RebuildGraphWithCollapseState();
             UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart: All nodes collapsed");
 
             // Publish all-collapsed event for TreeView sync (unless handling external event)
@@ -291,8 +430,12 @@ namespace DialogEditor.ViewModels
         /// </summary>
         public void ExpandAll()
         {
-            _collapsedNodeIds.Clear();
-            RebuildGraphWithCollapseState();
+            // Nothing collapsed means the full graph is already shown
+            if (_collapsedNodeIds.Count > 0)
+            {
+                _collapsedNodeIds.Clear();
+                RebuildGraphWithCollapseState();
+            }
             UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart: All nodes expanded");
 
             // Publish all-expanded event for TreeView sync (unless handling external event)
@@ -450,11 +593,10 @@ namespace DialogEditor.ViewModels
             foreach (var edge in graph.GetOutgoingEdges(parentId))
             {
                 var childId = edge.TargetId;
-                if (!hiddenNodes.Contains(childId))
-                {
-                    // Hide this child (including link nodes - they should collapse too)
-                    hiddenNodes.Add(childId);
 
+                // Hide this child (including link nodes - they should collapse too)
+                if (hiddenNodes.Add(childId))
+                {
                     // Only recurse into non-link nodes
                     // Link nodes are terminal - their target is elsewhere in the graph
                     if (graph.Nodes.TryGetValue(childId, out var childNode) && !childNode.IsLink)
@@ -60,6 +60,21 @@ namespace DialogEditor.Views
         private Point _dragStartPoint;
         private FlowchartNode? _draggedNode;
 
+        // Drop-target validation for the current drag. The dialog can't change mid-drag, so
+        // results are kept per hovered node instead of re-validated on every pointer move.
+        private enum DragTargetKind { Invalid, Sibling, Reparent }
+        private FlowchartNode? _dragHoverNode;
+        private DragTargetKind _dragHoverKind;
+        private bool? _rootDropValid;
+        private StandardCursorType? _dragCursorType;
+
+        // Set while a theme/settings visual rebuild is queued on the dispatcher
+        private bool _visualRebuildPending;
+
+        // Diagnostics in zoom/pointer handlers build long interpolated strings on every
+        // event; skip that work unless DEBUG logging is actually enabled.
+        private static bool IsDebugLogging => UnifiedLogger.CurrentLogLevel >= LogLevel.DEBUG;
+
         // #809: Keyboard shortcut handler for forwarding to parent window
         private KeyboardShortcutManager? _shortcutManager;
 
@@ -126,6 +141,19 @@ namespace DialogEditor.Views
             // Keyboard shortcuts when panel has focus
             KeyDown += OnKeyDown;
 
+            // Re-fit when viewport size changes (if in fit mode)
+            FlowchartScrollViewer.PropertyChanged += OnScrollViewerPropertyChanged;
+
+            // Context menu click handlers are attached via XAML Click events (#461)
+
+            // Subscribe to singleton events only while attached (#1282). The tabbed panel is
+            // detached and re-attached as tabs switch, so subscriptions are renewed on attach.
+            AttachedToVisualTree += OnAttachedToVisualTree;
+            DetachedFromVisualTree += OnDetachedFromVisualTree;
+        }
+
+        private void OnAttachedToVisualTree(object? sender, VisualTreeAttachmentEventArgs e)
+        {
             // Listen for settings changes to refresh colors (#340)
             _settings.PropertyChanged += OnSettingsChanged;
 
@@ -137,20 +165,27 @@ namespace DialogEditor.Views
 
             // Subscribe to collapse/expand events from TreeView (#451)
             DialogChangeEventBus.Instance.DialogChanged += OnDialogChanged;
-
-            // Re-fit when viewport size changes (if in fit mode)
-            FlowchartScrollViewer.PropertyChanged += OnScrollViewerPropertyChanged;
-
-            // Context menu click handlers are attached via XAML Click events (#461)
-
-            // Unsubscribe from singleton events when control is detached (#1282)
-            DetachedFromVisualTree += OnDetachedFromVisualTree;
         }
 
         private void OnDetachedFromVisualTree(object? sender, VisualTreeAttachmentEventArgs e)
         {
+            _settings.PropertyChanged -= OnSettingsChanged;
+            _uiSettings.PropertyChanged -= OnUISettingsChanged;
             ThemeManager.Instance.ThemeApplied -= OnThemeApplied;
             DialogChangeEventBus.Instance.DialogChanged -= OnDialogChanged;
+
+            // Closing the host window mid-drag or mid-pan never delivers the pointer
+            // release; drop the in-flight state so it can't leak into the next attach.
+            if (_isDragging)
+            {
+                FlowchartGraphPanel.Cursor = Avalonia.Input.Cursor.Default;
+            }
+            ResetDragState();
+            if (_isPanning)
+            {
+                _isPanning = false;
+                FlowchartScrollViewer.Cursor = null;
+            }
         }
 
         // Track the current node for context menu actions
@@ -198,14 +233,18 @@ namespace DialogEditor.Views
         private void OnScrollViewerPropertyChanged(object? sender, AvaloniaPropertyChangedEventArgs e)
         {
             // Re-fit when bounds change while in fit mode
-            if (_isFitMode && e.Property == BoundsProperty)
+            if (_isFitMode && e.Property == BoundsProperty && !_refitPending)
             {
-                // Debounce to avoid excessive recalculations during resize
+                // Debounce to avoid excessive recalculations during resize: a drag-resize
+                // raises Bounds many times per frame, but only one re-fit is queued at a time
+                _refitPending = true;
                 Avalonia.Threading.Dispatcher.UIThread.Post(() =>
                 {
+                    _refitPending = false;
                     if (_isFitMode && _viewModel.HasContent)
                     {
-                        FitToWindow();
+                        // Only the viewport changed - reuse the measured content size
+                        FitToWindow(reuseContentSize: true);
                     }
                 }, Avalonia.Threading.DispatcherPriority.Background);
             }
@@ -225,37 +264,16 @@ namespace DialogEditor.Views
                 });
             }
 
-            // #809: Refresh FlowView on structural changes and property edits
-            if (e.ChangeType == DialogChangeType.NodeAdded ||
-                e.ChangeType == DialogChangeType.NodeDeleted ||
-                e.ChangeType == DialogChangeType.NodeMoved ||
-                e.ChangeType == DialogChangeType.NodeModified ||
-                e.ChangeType == DialogChangeType.DialogRefreshed)
-            {
-                Avalonia.Threading.Dispatcher.UIThread.Post(() =>
-                {
-                    _viewModel.RefreshGraph();
-                    UnifiedLogger.LogUI(LogLevel.DEBUG, $"FlowView refreshed due to {e.ChangeType}");
-                });
-            }
+            // Structural changes and property edits (#809) are pushed by
+            // FlowchartManager.UpdateAllPanels, which MainWindow drives from the same
+            // bus events with the current dialog. Rebuilding here as well converted
+            // and laid out the graph twice per edit.
         }
 
         private void OnThemeApplied(object? sender, EventArgs e)
         {
             // Refresh flowchart colors when theme changes
-            Avalonia.Threading.Dispatcher.UIThread.Post(() =>
-            {
-                // Force complete visual refresh by toggling visibility
-                // This forces Avalonia to recreate the visual tree with new theme colors
-                FlowchartScrollViewer.IsVisible = false;
-                _viewModel.RefreshGraph();
-
-                Avalonia.Threading.Dispatcher.UIThread.Post(() =>
-                {
-                    FlowchartScrollViewer.IsVisible = true;
-                    UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart colors refreshed after theme change");
-                }, Avalonia.Threading.DispatcherPriority.Background);
-            });
+            ScheduleRebuildVisualTree("Flowchart colors refreshed after theme change");
         }
 
         private void OnSettingsChanged(object? sender, PropertyChangedEventArgs e)
@@ -267,17 +285,7 @@ namespace DialogEditor.Views
                 // Force complete visual refresh by toggling visibility (#1223)
                 // Same pattern as OnThemeApplied - Avalonia needs visual tree recreation
                 // to re-evaluate converters with updated speaker colors
-                Avalonia.Threading.Dispatcher.UIThread.Post(() =>
-                {
-                    FlowchartScrollViewer.IsVisible = false;
-                    _viewModel.RefreshGraph();
-
-                    Avalonia.Threading.Dispatcher.UIThread.Post(() =>
-                    {
-                        FlowchartScrollViewer.IsVisible = true;
-                        UnifiedLogger.LogUI(LogLevel.DEBUG, $"Flowchart colors refreshed due to {e.PropertyName} change");
-                    }, Avalonia.Threading.DispatcherPriority.Background);
-                });
+                ScheduleRebuildVisualTree($"Flowchart colors refreshed due to {e.PropertyName} change");
             }
         }
 
@@ -332,8 +340,32 @@ namespace DialogEditor.Views
 
         private void OnRefreshClick(object? sender, RoutedEventArgs e)
         {
-            // Force complete visual refresh by toggling visibility
-            // This forces Avalonia to recreate the visual tree and re-evaluate all converters
+            RebuildVisualTree("Flowchart manually refreshed with visual tree rebuild");
+        }
+
+        /// <summary>
+        /// Queues a visual tree rebuild. A theme switch or settings save can raise several
+        /// change notifications back to back; they share one rebuild instead of one each.
+        /// </summary>
+        private void ScheduleRebuildVisualTree(string logMessage)
+        {
+            if (_visualRebuildPending)
+                return;
+
+            _visualRebuildPending = true;
+            Avalonia.Threading.Dispatcher.UIThread.Post(() =>
+            {
+                _visualRebuildPending = false;
+                RebuildVisualTree(logMessage);
+            });
+        }
+
+        /// <summary>
+        /// Force complete visual refresh by toggling visibility. This forces Avalonia to
+        /// recreate the visual tree and re-evaluate all converters (theme, speaker colors).
+        /// </summary>
+        private void RebuildVisualTree(string logMessage)
+        {
             FlowchartScrollViewer.IsVisible = false;
             _viewModel.RefreshGraph();
 
@@ -341,7 +373,7 @@ namespace DialogEditor.Views
             Avalonia.Threading.Dispatcher.UIThread.Post(() =>
             {
                 FlowchartScrollViewer.IsVisible = true;
-                UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart manually refreshed with visual tree rebuild");
+                UnifiedLogger.LogUI(LogLevel.DEBUG, logMessage);
             }, Avalonia.Threading.DispatcherPriority.Background);
         }
 
@@ -432,6 +464,7 @@ namespace DialogEditor.Views
             ZoomLevelText.Text = $"{(int)(_currentZoom * 100)}%";
 
             // Log extent vs viewport for debugging scrollbar/panning behavior
+            if (!IsDebugLogging) return;
             Avalonia.Threading.Dispatcher.UIThread.Post(() =>
             {
                 var maxScrollX = FlowchartScrollViewer.Extent.Width - FlowchartScrollViewer.Viewport.Width;
@@ -442,30 +475,53 @@ namespace DialogEditor.Views
 
         // Track if we're in "fit mode" (with centered alignment)
         private bool _isFitMode;
+        private bool _refitPending;
 
-        private void FitToWindow()
-        {
-            // Reset to 1.0 first to get accurate unscaled bounds
-            ZoomContainer.LayoutTransform = new ScaleTransform(1.0, 1.0);
-            ZoomContainer.Margin = new Thickness(0);
-            ZoomContainer.UpdateLayout();
+        // Unscaled content size from the last full fit. Resizing only changes the viewport,
+        // so re-fits reuse it instead of forcing a layout pass at zoom 1.0 to re-measure.
+        private Size? _fitContentSize;
+        private object? _fitContentGraph;
 
+        private void FitToWindow(bool reuseContentSize = false)
+        {
+            double contentWidth, contentHeight;
             var scrollViewerBounds = FlowchartScrollViewer.Bounds;
-            if (scrollViewerBounds.Width <= 0 || scrollViewerBounds.Height <= 0)
-            {
-                SetZoom(1.0);
-                return;
-            }
 
-            // Find the actual content bounds by scanning visual children
-            var contentBounds = GetGraphContentBounds();
-            if (contentBounds == null)
+            if (reuseContentSize && _fitContentSize is { } cachedSize &&
+                ReferenceEquals(_fitContentGraph, _viewModel.Graph))
             {
-                SetZoom(1.0);
-                return;
+                if (scrollViewerBounds.Width <= 0 || scrollViewerBounds.Height <= 0)
+                    return;
+
+                contentWidth = cachedSize.Width;
+                contentHeight = cachedSize.Height;
             }
+            else
+            {
+                // Reset to 1.0 first to get accurate unscaled bounds
+                ZoomContainer.LayoutTransform = new ScaleTransform(1.0, 1.0);
+                ZoomContainer.Margin = new Thickness(0);
+                ZoomContainer.UpdateLayout();
 
-            var (_, _, contentWidth, contentHeight) = contentBounds.Value;
+                scrollViewerBounds = FlowchartScrollViewer.Bounds;
+                if (scrollViewerBounds.Width <= 0 || scrollViewerBounds.Height <= 0)
+                {
+                    SetZoom(1.0);
+                    return;
+                }
+
+                // Find the actual content bounds by scanning visual children
+                var contentBounds = GetGraphContentBounds();
+                if (contentBounds == null)
+                {
+                    SetZoom(1.0);
+                    return;
+                }
+
+                (_, _, contentWidth, contentHeight) = contentBounds.Value;
+                _fitContentSize = new Size(contentWidth, contentHeight);
+                _fitContentGraph = _viewModel.Graph;
+            }
 
             // Calculate zoom based on actual content size (not panel size)
             var scaleX = scrollViewerBounds.Width / contentWidth;
@@ -531,26 +587,39 @@ namespace DialogEditor.Views
             bool shouldPan = point.Properties.IsMiddleButtonPressed ||
                             (point.Properties.IsLeftButtonPressed && e.KeyModifiers.HasFlag(KeyModifiers.Shift));
 
-            UnifiedLogger.LogUI(LogLevel.DEBUG, $"PointerPressed: left={point.Properties.IsLeftButtonPressed}, shift={e.KeyModifiers.HasFlag(KeyModifiers.Shift)}, shouldPan={shouldPan}");
+            if (IsDebugLogging)
+                UnifiedLogger.LogUI(LogLevel.DEBUG, $"PointerPressed: left={point.Properties.IsLeftButtonPressed}, shift={e.KeyModifiers.HasFlag(KeyModifiers.Shift)}, shouldPan={shouldPan}");
 
             if (shouldPan)
             {
-                _isPanning = true;
-                _panStartPoint = point.Position;
-                _panStartOffset = new Vector(FlowchartScrollViewer.Offset.X, FlowchartScrollViewer.Offset.Y);
+                StartPanning(e, "Panning started");
+            }
+        }
+
+        /// <summary>
+        /// Enter pan mode: record start point/offset, capture the pointer on the
+        /// ScrollViewer and show the pan cursor.
+        /// </summary>
+        private void StartPanning(PointerPressedEventArgs e, string logPrefix)
+        {
+            _isPanning = true;
+            _panStartPoint = e.GetPosition(FlowchartScrollViewer);
+            _panStartOffset = new Vector(FlowchartScrollViewer.Offset.X, FlowchartScrollViewer.Offset.Y);
 
+            if (IsDebugLogging)
+            {
                 var maxScrollX = FlowchartScrollViewer.Extent.Width - FlowchartScrollViewer.Viewport.Width;
                 var maxScrollY = FlowchartScrollViewer.Extent.Height - FlowchartScrollViewer.Viewport.Height;
                 var canPan = maxScrollX > 0 || maxScrollY > 0;
-                UnifiedLogger.LogUI(LogLevel.DEBUG, $"Panning started: offset=({_panStartOffset.X:F0},{_panStartOffset.Y:F0}), extent=({FlowchartScrollViewer.Extent.Width:F0}x{FlowchartScrollViewer.Extent.Height:F0}), viewport=({FlowchartScrollViewer.Viewport.Width:F0}x{FlowchartScrollViewer.Viewport.Height:F0}), maxScroll=({maxScrollX:F0},{maxScrollY:F0}), canPan={canPan}");
+                UnifiedLogger.LogUI(LogLevel.DEBUG, $"{logPrefix}: offset=({_panStartOffset.X:F0},{_panStartOffset.Y:F0}), extent=({FlowchartScrollViewer.Extent.Width:F0}x{FlowchartScrollViewer.Extent.Height:F0}), viewport=({FlowchartScrollViewer.Viewport.Width:F0}x{FlowchartScrollViewer.Viewport.Height:F0}), maxScroll=({maxScrollX:F0},{maxScrollY:F0}), canPan={canPan}");
+            }
 
-                // Capture the pointer for reliable tracking
-                e.Pointer.Capture(FlowchartScrollViewer);
-                e.Handled = true;
+            // Capture the pointer for reliable tracking
+            e.Pointer.Capture(FlowchartScrollViewer);
+            e.Handled = true;
 
-                // Change cursor to indicate panning
-                FlowchartScrollViewer.Cursor = new Avalonia.Input.Cursor(StandardCursorType.SizeAll);
-            }
+            // Change cursor to indicate panning
+            FlowchartScrollViewer.Cursor = new Avalonia.Input.Cursor(StandardCursorType.SizeAll);
         }
 
         private void OnScrollViewerPointerMoved(object? sender, PointerEventArgs e)
@@ -599,18 +668,7 @@ namespace DialogEditor.Views
             if (shouldPan)
             {
                 // Delegate to ScrollViewer panning
-                _isPanning = true;
-                _panStartPoint = e.GetPosition(FlowchartScrollViewer);
-                _panStartOffset = new Vector(FlowchartScrollViewer.Offset.X, FlowchartScrollViewer.Offset.Y);
-
-                var maxScrollX = FlowchartScrollViewer.Extent.Width - FlowchartScrollViewer.Viewport.Width;
-                var maxScrollY = FlowchartScrollViewer.Extent.Height - FlowchartScrollViewer.Viewport.Height;
-                var canPan = maxScrollX > 0 || maxScrollY > 0;
-                UnifiedLogger.LogUI(LogLevel.DEBUG, $"Panning started (from GraphPanel): offset=({_panStartOffset.X:F0},{_panStartOffset.Y:F0}), extent=({FlowchartScrollViewer.Extent.Width:F0}x{FlowchartScrollViewer.Extent.Height:F0}), viewport=({FlowchartScrollViewer.Viewport.Width:F0}x{FlowchartScrollViewer.Viewport.Height:F0}), maxScroll=({maxScrollX:F0},{maxScrollY:F0}), canPan={canPan}");
-
-                e.Pointer.Capture(FlowchartScrollViewer);
-                e.Handled = true;
-                FlowchartScrollViewer.Cursor = new Avalonia.Input.Cursor(StandardCursorType.SizeAll);
+                StartPanning(e, "Panning started (from GraphPanel)");
                 return;
             }
 
@@ -682,7 +740,7 @@ namespace DialogEditor.Views
                 {
                     _isDragging = true;
                     _dragPotential = false;
-                    FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.DragMove);
+                    SetDragCursor(StandardCursorType.DragMove);
                     UnifiedLogger.LogUI(LogLevel.DEBUG, $"Drag started for node {_draggedNode?.Id}");
                 }
                 else
@@ -700,41 +758,62 @@ namespace DialogEditor.Views
 
             if (targetNode != null && targetNode != _draggedNode)
             {
-                if (AreSiblings(targetNode, _draggedNode))
-                {
-                    // Sibling reorder (#240)
-                    ShowInsertionIndicator(targetNode, currentPos);
-                    FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.DragMove);
-                }
-                else if (IsValidReparentTarget(targetNode, _draggedNode))
-                {
-                    // Valid reparent target (#1965)
-                    ShowInsertionIndicator(targetNode, currentPos);
-                    FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.DragLink);
-                }
-                else
+                switch (GetDragTargetKind(targetNode, _draggedNode))
                 {
-                    // Invalid target
-                    HideInsertionIndicator();
-                    FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.No);
+                    case DragTargetKind.Sibling:
+                        // Sibling reorder (#240) - the cursor is the drop feedback; a visual
+                        // insertion line would need an overlay on AvaloniaGraphControl's layout
+                        SetDragCursor(StandardCursorType.DragMove);
+                        break;
+                    case DragTargetKind.Reparent:
+                        // Valid reparent target (#1965)
+                        SetDragCursor(StandardCursorType.DragLink);
+                        break;
+                    default:
+                        // Invalid target
+                        SetDragCursor(StandardCursorType.No);
+                        break;
                 }
             }
             else if (targetNode == null)
             {
                 // #2060: Dragging over empty background (or ROOT visual) — drop-to-root if valid.
-                HideInsertionIndicator();
-                FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(
-                    IsValidRootDropTarget(_draggedNode)
-                        ? StandardCursorType.DragLink
-                        : StandardCursorType.No);
+                _rootDropValid ??= IsValidRootDropTarget(_draggedNode);
+                SetDragCursor(_rootDropValid.Value ? StandardCursorType.DragLink : StandardCursorType.No);
             }
             else
             {
-                HideInsertionIndicator();
-                FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.DragMove);
+                SetDragCursor(StandardCursorType.DragMove);
             }
         }
 
+        /// <summary>
+        /// Classifies a hovered drop target, reusing the result while the pointer stays on the same node.
+        /// </summary>
+        private DragTargetKind GetDragTargetKind(FlowchartNode target, FlowchartNode dragged)
+        {
+            if (target == _dragHoverNode)
+                return _dragHoverKind;
+
+            _dragHoverNode = target;
+            _dragHoverKind = AreSiblings(target, dragged) ? DragTargetKind.Sibling
+                : IsValidReparentTarget(target, dragged) ? DragTargetKind.Reparent
+                : DragTargetKind.Invalid;
+            return _dragHoverKind;
+        }
+
+        /// <summary>
+        /// Sets the drag cursor only when it changes, rather than creating a new cursor per pointer move.
+        /// </summary>
+        private void SetDragCursor(StandardCursorType cursorType)
+        {
+            if (_dragCursorType == cursorType)
+                return;
+
+            _dragCursorType = cursorType;
+            FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(cursorType);
+        }
+
         /// <summary>
         /// #2060: True if the dragged node may be dropped onto the empty background
         /// to become a new root start point. Delegates to the shared validator.
@@ -782,7 +861,6 @@ namespace DialogEditor.Views
                     ExecuteReparentToRoot(_draggedNode);
                 }
 
-                HideInsertionIndicator();
                 FlowchartGraphPanel.Cursor = Avalonia.Input.Cursor.Default;
                 UnifiedLogger.LogUI(LogLevel.DEBUG, "Drag ended");
             }
@@ -802,6 +880,9 @@ namespace DialogEditor.Views
             _isDragging = false;
             _dragPotential = false;
             _draggedNode = null;
+            _dragHoverNode = null;
+            _rootDropValid = null;
+            _dragCursorType = null;
         }
 
         /// <summary>
@@ -937,25 +1018,6 @@ namespace DialogEditor.Views
             return null;
         }
 
-        /// <summary>
-        /// Shows an insertion indicator line near the target node (#240).
-        /// </summary>
-        private void ShowInsertionIndicator(FlowchartNode targetNode, Point cursorPos)
-        {
-            // For now, change the cursor to indicate valid drop
-            // Full visual indicator requires overlay on the GraphPanel which is complex
-            // with AvaloniaGraphControl's layout system — the cursor change provides feedback
-            FlowchartGraphPanel.Cursor = new Avalonia.Input.Cursor(StandardCursorType.DragMove);
-        }
-
-        /// <summary>
-        /// Hides the insertion indicator (#240).
-        /// </summary>
-        private void HideInsertionIndicator()
-        {
-            // Clear any visual indicator state
-        }
-
         #endregion
 
         #region Public API
@@ -965,9 +1027,20 @@ namespace DialogEditor.Views
         /// </summary>
         /// <param name="dialog">The dialog to display</param>
         /// <param name="fileName">Optional filename for display</param>
-        public void UpdateDialog(Dialog? dialog, string? fileName = null)
+        public bool UpdateDialog(Dialog? dialog, string? fileName = null)
         {
-            _viewModel.UpdateDialog(dialog, fileName);
+            // Labels may be patched in place, which can resize nodes without a new Graph
+            _fitContentSize = null;
+            return _viewModel.UpdateDialog(dialog, fileName);
+        }
+
+        /// <summary>
+        /// Repaint a node after a text-only edit without rebuilding the graph (#2032)
+        /// </summary>
+        public void UpdateNodeContent(Dialog? dialog, DialogNode? changedNode, string? fileName = null)
+        {
+            _fitContentSize = null;
+            _viewModel.UpdateNodeContent(dialog, changedNode, fileName);
         }
 
         /// <summary>
@@ -987,6 +1060,15 @@ namespace DialogEditor.Views
             _viewModel.SelectNode(dialogNode);
         }
 
+        /// <summary>
+        /// Re-applies the TreeView selection after UpdateDialog, keeping the current
+        /// FlowView selection when the graph wasn't replaced
+        /// </summary>
+        public void ResyncSelection(DialogNode? dialogNode, bool graphReplaced)
+        {
+            _viewModel.ResyncSelection(dialogNode, graphReplaced);
+        }
+
         /// <summary>
         /// Gets or sets the selected node ID directly
         /// </summary>
@@ -2,6 +2,7 @@ using System;
 using System.Threading.Tasks;
 using Avalonia;
 using Avalonia.Controls;
+using Avalonia.Threading;
 using DialogEditor.Models;
 using DialogEditor.Services;
 using Microsoft.Extensions.DependencyInjection;
@@ -16,9 +17,15 @@ namespace DialogEditor.Views
     /// </summary>
     public partial class FlowchartWindow : Window
     {
+        // Title shown when no dialog file is loaded (matches the XAML default)
+        private const string DefaultTitle = "Flowchart View";
+
         private readonly ISettingsService _settings;
         private bool _isRestoringPosition = false;
 
+        // Dragging or resizing fires a change per frame; each save writes settings to disk
+        private readonly DispatcherTimer _savePositionTimer;
+
         /// <summary>
         /// Raised when a flowchart node is clicked.
         /// The FlowchartNode parameter contains the clicked node with context (IsLink, OriginalPointer, etc.)
@@ -60,7 +67,12 @@ namespace DialogEditor.Views
             // Restore window position after window opens (Screens not available in constructor)
             Opened += async (s, e) => await RestoreWindowPositionAsync();
 
-            // Save position when window moves or resizes
+            // Save position when window moves or resizes (debounced)
+            _savePositionTimer = new DispatcherTimer
+            {
+                Interval = TimeSpan.FromMilliseconds(300)
+            };
+            _savePositionTimer.Tick += OnSavePositionTimerTick;
             PositionChanged += OnPositionChanged;
             PropertyChanged += OnPropertyChanged;
             Closed += OnWindowClosed;
@@ -128,7 +140,7 @@ namespace DialogEditor.Views
         {
             if (!_isRestoringPosition)
             {
-                SaveWindowPosition();
+                ScheduleSaveWindowPosition();
             }
         }
 
@@ -136,10 +148,23 @@ namespace DialogEditor.Views
         {
             if (!_isRestoringPosition && (e.Property == WidthProperty || e.Property == HeightProperty))
             {
-                SaveWindowPosition();
+                ScheduleSaveWindowPosition();
             }
         }
 
+        private void ScheduleSaveWindowPosition()
+        {
+            // Restart the timer so a drag or resize saves once, after it settles
+            _savePositionTimer.Stop();
+            _savePositionTimer.Start();
+        }
+
+        private void OnSavePositionTimerTick(object? sender, EventArgs e)
+        {
+            _savePositionTimer.Stop();
+            SaveWindowPosition();
+        }
+
         private void SaveWindowPosition()
         {
             var settings = _settings;
@@ -159,6 +184,13 @@ namespace DialogEditor.Views
 
         private void OnWindowClosed(object? sender, EventArgs e)
         {
+            // Flush a pending position save so the last move isn't lost
+            if (_savePositionTimer.IsEnabled)
+            {
+                _savePositionTimer.Stop();
+                SaveWindowPosition();
+            }
+
             // Mark flowchart as closed (#377)
             _settings.FlowchartWindowOpen = false;
             UnifiedLogger.LogUI(LogLevel.DEBUG, "Flowchart window closed, FlowchartWindowOpen = false");
@@ -169,9 +201,9 @@ namespace DialogEditor.Views
         /// </summary>
         /// <param name="dialog">The dialog to display</param>
         /// <param name="fileName">Optional filename for display</param>
-        public void UpdateDialog(Dialog? dialog, string? fileName = null)
+        public bool UpdateDialog(Dialog? dialog, string? fileName = null)
         {
-            FlowchartPanelControl.UpdateDialog(dialog, fileName);
+            var graphReplaced = FlowchartPanelControl.UpdateDialog(dialog, fileName);
 
             // Update window title with filename
             if (!string.IsNullOrEmpty(fileName))
@@ -180,8 +212,19 @@ namespace DialogEditor.Views
             }
             else
             {
-                Title = "Flowchart View";
+                Title = DefaultTitle;
             }
+
+            return graphReplaced;
+        }
+
+        /// <summary>
+        /// Repaint a node after a text-only edit without rebuilding the graph (#2032).
+        /// The title only depends on the filename, which a text edit doesn't change.
+        /// </summary>
+        public void UpdateNodeContent(Dialog? dialog, DialogNode? changedNode, string? fileName = null)
+        {
+            FlowchartPanelControl.UpdateNodeContent(dialog, changedNode, fileName);
         }
 
         /// <summary>
@@ -190,7 +233,7 @@ namespace DialogEditor.Views
         public void Clear()
         {
             FlowchartPanelControl.Clear();
-            Title = "Flowchart View";
+            Title = DefaultTitle;
         }
 
         /// <summary>
@@ -202,6 +245,15 @@ namespace DialogEditor.Views
             FlowchartPanelControl.SelectNode(dialogNode);
         }
 
+        /// <summary>
+        /// Re-applies the TreeView selection after UpdateDialog, keeping the current
+        /// FlowView selection when the graph wasn't replaced
+        /// </summary>
+        public void ResyncSelection(DialogNode? dialogNode, bool graphReplaced)
+        {
+            FlowchartPanelControl.ResyncSelection(dialogNode, graphReplaced);
+        }
+
         /// <summary>
         /// Sets the keyboard shortcut manager for the embedded panel.
         /// #809: Enables keyboard parity with TreeView in floating window.
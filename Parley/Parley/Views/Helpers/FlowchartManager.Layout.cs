@@ -142,12 +142,13 @@ namespace Parley.Views.Helpers
                         panel.SiblingReorderRequested += OnFlowchartSiblingReorder; // #240: Drag-drop reorder
                         panel.ReparentRequested += OnFlowchartReparent; // #1965: Drag-drop reparent
                         panel.ShortcutManager = _shortcutManager; // #809: Enable keyboard shortcuts
+
+                        // Watch for column width changes to save (#377). Wired once with the
+                        // panel - re-subscribing on every show saved the width N times per drag.
+                        grid.ColumnDefinitions[4].PropertyChanged += OnFlowchartColumnWidthChanged;
                         _embeddedFlowchartWired = true;
                     }
 
-                    // Watch for column width changes to save (#377)
-                    grid.ColumnDefinitions[4].PropertyChanged += OnFlowchartColumnWidthChanged;
-
                     // Update with current dialog
                     panel.UpdateDialog(ViewModel.CurrentDialog, ViewModel.CurrentFileName);
                 });
@@ -1,4 +1,6 @@
+using System.Collections.Generic;
 using Avalonia.Controls;
+using Avalonia.Threading;
 using DialogEditor.Models;
 using DialogEditor.Services;
 using DialogEditor.Views;
@@ -14,31 +16,91 @@ namespace Parley.Views.Helpers
         /// <summary>
         /// Updates all flowchart panels (floating, embedded, tabbed) with current dialog.
         /// Called when dialog structure changes to keep FlowView in sync with TreeView.
+        /// The update is deferred to the dispatcher so a burst of changes (paste, bulk
+        /// delete, undo) rebuilds the panels once instead of once per event.
         /// </summary>
         public void UpdateAllPanels()
         {
-            if (ViewModel.CurrentDialog == null)
+            if (_panelUpdatePending)
                 return;
 
+            _panelUpdatePending = true;
+            Dispatcher.UIThread.Post(() =>
+            {
+                _panelUpdatePending = false;
+                UpdateAllPanelsNow();
+            }, DispatcherPriority.Background);
+        }
+
+        private void UpdateAllPanelsNow()
+        {
+            // Read the dialog state once and hand the same snapshot to every panel
+            var viewModel = ViewModel;
+            var dialog = viewModel.CurrentDialog;
+            if (dialog == null)
+                return;
+            var fileName = viewModel.CurrentFileName;
+
+            // Selection may have been synced before a rebuild (e.g. a just-added node), so
+            // re-apply it to replaced graphs. Panels that kept their graph keep their selection,
+            // which may be a link node clicked in FlowView.
+            var selectedNode = _getSelectedNode()?.OriginalNode;
+
             // Update floating flowchart window if open
             _windows.WithWindow<FlowchartWindow>(WindowKeys.Flowchart, w =>
             {
-                w.UpdateDialog(ViewModel.CurrentDialog, ViewModel.CurrentFileName);
+                w.ResyncSelection(selectedNode, w.UpdateDialog(dialog, fileName));
             });
 
-            // Update embedded panel (side-by-side layout)
-            var embeddedPanel = _window.FindControl<FlowchartPanel>("EmbeddedFlowchartPanel");
-            if (embeddedPanel != null)
+            // Hidden panels are skipped - Show*Flowchart refreshes them when they become visible
+            var embeddedPanel = GetVisibleEmbeddedPanel();
+            embeddedPanel?.ResyncSelection(selectedNode, embeddedPanel.UpdateDialog(dialog, fileName));
+            var tabbedPanel = GetVisibleTabbedPanel();
+            tabbedPanel?.ResyncSelection(selectedNode, tabbedPanel.UpdateDialog(dialog, fileName));
+        }
+
+        /// <summary>
+        /// Repaints a node in all flowchart panels after a text-only edit (#2032).
+        /// Panels patch the node in place instead of re-converting and re-laying out the graph.
+        /// Like UpdateAllPanels, edits are collected and applied in one deferred pass; a
+        /// pending full update supersedes them.
+        /// </summary>
+        public void UpdateNodeInAllPanels(DialogNode changedNode)
+        {
+            if (!_pendingNodeUpdates.Add(changedNode) || _pendingNodeUpdates.Count > 1)
+                return;
+
+            Dispatcher.UIThread.Post(() =>
             {
-                embeddedPanel.UpdateDialog(ViewModel.CurrentDialog, ViewModel.CurrentFileName);
-            }
+                var changedNodes = new List<DialogNode>(_pendingNodeUpdates);
+                _pendingNodeUpdates.Clear();
 
-            // Update tabbed panel
-            var tabbedPanel = _window.FindControl<FlowchartPanel>("TabbedFlowchartPanel");
-            if (tabbedPanel != null)
+                // The full rebuild already picks up the new text
+                if (_panelUpdatePending)
+                    return;
+
+                foreach (var node in changedNodes)
+                {
+                    UpdateNodeInAllPanelsNow(node);
+                }
+            }, DispatcherPriority.Background);
+        }
+
+        private void UpdateNodeInAllPanelsNow(DialogNode changedNode)
+        {
+            var viewModel = ViewModel;
+            var dialog = viewModel.CurrentDialog;
+            if (dialog == null)
+                return;
+            var fileName = viewModel.CurrentFileName;
+
+            _windows.WithWindow<FlowchartWindow>(WindowKeys.Flowchart, w =>
             {
-                tabbedPanel.UpdateDialog(ViewModel.CurrentDialog, ViewModel.CurrentFileName);
-            }
+                w.UpdateNodeContent(dialog, changedNode, fileName);
+            });
+
+            GetVisibleEmbeddedPanel()?.UpdateNodeContent(dialog, changedNode, fileName);
+            GetVisibleTabbedPanel()?.UpdateNodeContent(dialog, changedNode, fileName);
         }
 
         /// <summary>
@@ -107,21 +169,31 @@ namespace Parley.Views.Helpers
             // Sync to floating window
             _windows.WithWindow<FlowchartWindow>(WindowKeys.Flowchart, w => w.SelectNode(originalNode));
 
-            // Sync to embedded panel
+            // Sync to embedded and tabbed panels
+            GetVisibleEmbeddedPanel()?.SelectNode(originalNode);
+            GetVisibleTabbedPanel()?.SelectNode(originalNode);
+        }
+
+        /// <summary>
+        /// Returns the side-by-side panel if its layout is currently shown, otherwise null.
+        /// </summary>
+        private FlowchartPanel? GetVisibleEmbeddedPanel()
+        {
             var embeddedBorder = _window.FindControl<Border>("EmbeddedFlowchartBorder");
-            var embeddedPanel = _window.FindControl<FlowchartPanel>("EmbeddedFlowchartPanel");
-            if (embeddedBorder?.IsVisible == true && embeddedPanel != null)
-            {
-                embeddedPanel.SelectNode(originalNode);
-            }
+            return embeddedBorder?.IsVisible == true
+                ? _window.FindControl<FlowchartPanel>("EmbeddedFlowchartPanel")
+                : null;
+        }
 
-            // Sync to tabbed panel
+        /// <summary>
+        /// Returns the tabbed panel if its tab is currently shown, otherwise null.
+        /// </summary>
+        private FlowchartPanel? GetVisibleTabbedPanel()
+        {
             var flowchartTab = _window.FindControl<TabItem>("FlowchartTab");
-            var tabbedPanel = _window.FindControl<FlowchartPanel>("TabbedFlowchartPanel");
-            if (tabbedPanel != null && flowchartTab?.IsVisible == true)
-            {
-                tabbedPanel.SelectNode(originalNode);
-            }
+            return flowchartTab?.IsVisible == true
+                ? _window.FindControl<FlowchartPanel>("TabbedFlowchartPanel")
+                : null;
         }
     }
 }
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using Avalonia.Controls;
 using DialogEditor.Models;
 using DialogEditor.Services;
@@ -43,6 +44,10 @@ namespace Parley.Views.Helpers
         private bool _embeddedFlowchartWired = false;
         private bool _tabbedFlowchartWired = false;
 
+        // Coalesces bursts of dialog-change events into a single panel update
+        private bool _panelUpdatePending;
+        private readonly HashSet<DialogNode> _pendingNodeUpdates = new();
+
         public FlowchartManager(
             Window window,
             SafeControlFinder controls,
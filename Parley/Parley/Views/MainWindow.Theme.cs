@@ -5,6 +5,7 @@ using Avalonia.Interactivity;
 using Avalonia.Media;
 using Avalonia.Styling;
 
+using DialogEditor.ViewModels;
 using Radoub.Formats.Logging;
 using Radoub.UI.Services;
 
@@ -87,6 +88,10 @@ namespace DialogEditor.Views
         /// </summary>
         private void OnThemeApplied(object? sender, EventArgs e)
         {
+            // Flowchart node brushes aren't keyed by theme - drop them here so
+            // panels that aren't attached (and so didn't hear this event) don't keep old colors
+            FlowchartPanelViewModel.InvalidateNodeStyles();
+
             // Only refresh if a dialog is loaded
             if (_viewModel.CurrentDialog != null)
             {
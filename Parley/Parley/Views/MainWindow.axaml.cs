@@ -459,6 +459,10 @@ namespace DialogEditor.Views
             if (e.PropertyName == nameof(SettingsService.EnableNpcTagColoring) ||
                 e.PropertyName == nameof(SettingsService.NpcSpeakerPreferences))
             {
+                // The dialog fingerprint doesn't cover settings - mark node styles stale so
+                // UpdateAllPanels rebuilds instead of skipping an unchanged dialog
+                FlowchartPanelViewModel.InvalidateNodeStyles();
+
                 if (_viewModel.CurrentDialog != null)
                 {
                     _treeRefreshCoordinator.RefreshPreservingSelection();
@@ -477,8 +481,15 @@ namespace DialogEditor.Views
         /// </summary>
         private void OnDialogChanged(object? sender, DialogChangeEventArgs e)
         {
+            // Text-only edits (#2032) repaint the affected node in place
+            if (e.ChangeType == DialogChangeType.NodeModified &&
+                e.ChangeKind == DialogChangeKind.TextOnly &&
+                e.AffectedNode != null)
+            {
+                _controllers.Flowchart.UpdateNodeInAllPanels(e.AffectedNode);
+            }
             // Update flowchart for structure changes and node modifications
-            if (e.ChangeType == DialogChangeType.DialogRefreshed ||
+            else if (e.ChangeType == DialogChangeType.DialogRefreshed ||
                 e.ChangeType == DialogChangeType.NodeAdded ||
                 e.ChangeType == DialogChangeType.NodeDeleted ||
                 e.ChangeType == DialogChangeType.NodeMoved ||